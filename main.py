@@ -1,11 +1,19 @@
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+import functools
 import json
 import logging
 import re
-from typing import Dict, List, Optional, Tuple
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from icalendar import Calendar, Event
+from icalendar.prop import vDatetime, vText
+import lxml.html
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
@@ -16,16 +24,28 @@ from webdriver_manager.chrome import ChromeDriverManager
 from webdriver_manager.core.os_manager import ChromeType
 
 # 常量配置
-BASE_URL = 'https://www.miyoushe.com/zzz/search'
 API_BASE_URL = 'https://bbs-api.miyoushe.com/painter/wapi/searchPosts'
+POST_FULL_API_URL = 'https://bbs-api.miyoushe.com/post/wapi/getPostFull'
+POST_URL_TEMPLATE = 'https://www.miyoushe.com/zzz/article/{post_id}'
+SEARCH_PAGE_SIZE = 20
+ZZZ_GIDS = 8  # 绝区零版块编号，与 https://www.miyoushe.com/zzz/search 的范围一致
 VERSION_FILE = 'version.json'
 ICS_FILE = 'zzz_events.ics'
 WAIT_TIMEOUT = 10
+MAX_WORKERS = 4
+HTTP_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+                  '(KHTML, like Gecko) Chrome/133.0.0.0 Safari/537.36',
+    'Referer': 'https://www.miyoushe.com/'
+}
 
 # 正则表达式模式
 AGENTS_PATTERN = r'\[(.*?)\((.*?)\)\]'
 TIME_PATTERN = r'(\d{4}/\d{1,2}/\d{1,2}\s+\d{1,2}:\d{2}:\d{2})\s*~\s*(\d{4}/\d{1,2}/\d{1,2}\s+\d{1,2}:\d{2}:\d{2})'
 VERSION_PATTERN = r'(\d+\.\d+)版本更新后\s*~\s*(\d{4}/\d{1,2}/\d{1,2}\s+\d{1,2}:\d{2}:\d{2})'
+_AGENTS_RE = re.compile(AGENTS_PATTERN)
+_TIME_RE = re.compile(TIME_PATTERN)
+_VERSION_RE = re.compile(VERSION_PATTERN)
 
 # 配置日志记录器
 logging.basicConfig(
@@ -36,12 +56,86 @@ logging.basicConfig(
 logger = logging.getLogger('mihoyo-ics')
 
 
+# 版本数据在所有爬取器之间共享，写回文件时加锁
+_version_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=1)
+def _load_version_data() -> Dict:
+    """加载版本数据，只读取一次文件"""
+    try:
+        with open(VERSION_FILE, 'r') as f:
+            return json.load(f)
+    except Exception as e:
+        logger.warning(f'读取版本文件失败: {str(e)}', exc_info=True)
+        return {}
+
+
+# 块级元素结束处需要换行，与innerText的分段方式保持一致
+_BLOCK_TAGS = frozenset((
+    'p', 'div', 'li', 'ul', 'ol', 'tr', 'table', 'blockquote', 'pre', 'section',
+    'h1', 'h2', 'h3', 'h4', 'h5', 'h6'
+))
+
+
+def _html_to_text(content: str) -> str:
+    """将帖子HTML转换为纯文本，在块级元素和<br>之后保留换行"""
+    tree = lxml.html.fromstring(content)
+    for element in tree.iter():
+        if element.tag == 'br' or element.tag in _BLOCK_TAGS:
+            element.tail = '\n' + (element.tail or '')
+    return tree.text_content().strip()
+
+
+def _fast_parse(value: str) -> datetime:
+    """解析正则已校验过的 YYYY/M/D H:M:S 格式时间，避免strptime的开销"""
+    date_part, time_part = value.split()
+    year, month, day = map(int, date_part.split('/'))
+    hour, minute, second = map(int, time_part.split(':'))
+    return datetime(year, month, day, hour, minute, second)
+
+
+_driver_path_lock = threading.Lock()
+_driver_path_cache = None
+
+
+def _driver_path() -> str:
+    """解析并缓存ChromeDriver路径，多个WebDriver只检查一次驱动版本"""
+    global _driver_path_cache
+    if _driver_path_cache is None:
+        # 工作线程可能同时回退到WebDriver，加锁保证只安装一次
+        with _driver_path_lock:
+            if _driver_path_cache is None:
+                _driver_path_cache = ChromeDriverManager(chrome_type=ChromeType.GOOGLE).install()
+    return _driver_path_cache
+
+
+def create_session() -> requests.Session:
+    """创建复用连接池的HTTP会话"""
+    session = requests.Session()
+    session.headers.update(HTTP_HEADERS)
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
 class PostCrawler:
     """帖子爬取器，负责获取和解析帖子内容"""
 
-    def __init__(self):
-        self.driver = self._init_webdriver()
-        self.wait = WebDriverWait(self.driver, WAIT_TIMEOUT)
+    def __init__(self, session: Optional[requests.Session] = None):
+        # 多个爬取器可共享同一会话，复用keep-alive连接
+        self.session = session or create_session()
+        self._version_cache = _load_version_data()
+        # WebDriver仅在接口获取帖子内容失败时按需启动
+        self.driver = None
+        self.wait = None
+
+    def _ensure_webdriver(self):
+        """按需初始化WebDriver"""
+        if self.driver is None:
+            self.driver = self._init_webdriver()
+            self.wait = WebDriverWait(self.driver, WAIT_TIMEOUT)
 
     def _init_webdriver(self) -> webdriver.Chrome:
         """初始化WebDriver"""
@@ -54,71 +148,87 @@ class PostCrawler:
                 "--ignore-certificate-errors",
                 "--disable-extensions",
                 "--no-sandbox",
-                "--disable-dev-shm-usage"
+                "--disable-dev-shm-usage",
+                # 只需读取文本，不加载图片和字体
+                "--blink-settings=imagesEnabled=false",
+                "--disable-remote-fonts",
+                "--disable-features=IsolateOrigins,site-per-process"
             ]
             for option in options:
                 chrome_options.add_argument(option)
+            chrome_options.add_experimental_option('prefs', {
+                'profile.managed_default_content_settings.images': 2,
+                'profile.default_content_setting_values.notifications': 2
+            })
+            # 导航后立即返回，由显式等待判断所需节点是否就绪
+            chrome_options.page_load_strategy = 'none'
             return webdriver.Chrome(
-                service=Service(ChromeDriverManager(chrome_type=ChromeType.GOOGLE).install()),
+                service=Service(_driver_path()),
                 options=chrome_options
             )
         except Exception as e:
             logger.error(f'初始化WebDriver失败: {str(e)}', exc_info=True)
             raise
 
-    def __del__(self):
-        if hasattr(self, 'driver'):
+    def close(self):
+        """关闭WebDriver，可重复调用"""
+        driver = getattr(self, 'driver', None)
+        if driver is not None:
+            self.driver = None
             try:
-                self.driver.quit()
+                driver.quit()
             except Exception as e:
                 logger.error(f'关闭WebDriver失败: {str(e)}', exc_info=True)
 
+    def __del__(self):
+        self.close()
+
     def get_posts(self, keyword: str) -> List[Dict[str, str]]:
         """获取调频说明帖子列表"""
         try:
             logger.info(f'开始获取关键词为 "{keyword}" 的帖子列表')
-            self.driver.get(f'{BASE_URL}?keyword={keyword}')
-            
-            self.wait.until(EC.presence_of_all_elements_located(
-                (By.CLASS_NAME, 'mhy-article-card')
-            ))
-            
+            response = self.session.get(
+                API_BASE_URL,
+                params={'keyword': keyword, 'gids': ZZZ_GIDS, 'size': SEARCH_PAGE_SIZE},
+                timeout=WAIT_TIMEOUT
+            )
+            data = orjson.loads(response.content)
+
+            if data['retcode'] != 0:
+                logger.error(f'搜索帖子接口返回错误: {data.get("message")}')
+                return []
+
             posts = []
-            article_list = self.driver.find_elements(By.CLASS_NAME, 'mhy-article-card')
-            
-            for article in article_list:
+            for item in data['data']['list']:
                 try:
-                    title_element = article.find_element(By.CLASS_NAME, 'mhy-article-card__title')
-                    link_element = article.find_element(By.CLASS_NAME, 'mhy-article-card__link')
-                    
-                    if title_element and link_element:
-                        posts.append({
-                            'title': title_element.text.strip(),
-                            'url': link_element.get_attribute('href')
-                        })
+                    post = item['post']
+                    # 音擎调频帖子必然会被内容校验丢弃，提前按标题过滤以省去内容请求
+                    if '音擎' in post['subject']:
+                        logger.info(f'帖子 "{post["subject"]}" 标题包含音擎关键词，跳过')
+                        continue
+                    posts.append({
+                        'title': post['subject'].strip(),
+                        'url': POST_URL_TEMPLATE.format(post_id=post['post_id'])
+                    })
                 except Exception as e:
-                    logger.warning(f'解析帖子元素失败: {str(e)}', exc_info=True)
+                    logger.warning(f'解析帖子数据失败: {str(e)}', exc_info=True)
                     continue
-            
+
             logger.info(f'成功获取到 {len(posts)} 个帖子')
             return posts
         except Exception as e:
             logger.error(f'获取帖子列表失败: {str(e)}', exc_info=True)
             return []
 
-    def parse_post_content(self, post_url: str) -> Optional[Dict]:
-        """解析单个帖子内容，提取活动时间和描述"""
+    def parse_post_content(self, post_url: str) -> Optional[Tuple[str, datetime, datetime]]:
+        """解析单个帖子内容，返回 (标题, 开始时间, 结束时间)"""
         try:
             logger.info(f'开始解析帖子内容: {post_url}')
-            self.driver.get(post_url)
-            
-            self.wait.until(EC.presence_of_element_located(
-                (By.CLASS_NAME, 'mhy-article-page__content')
-            ))
-            
-            title = self._get_element_text(By.CLASS_NAME, 'mhy-article-page__title')
-            description = self._get_element_text(By.CLASS_NAME, 'mhy-article-page__content')
-            
+            title, description = self._fetch_post_by_api(post_url)
+            if not description:
+                logger.info(f'接口未返回帖子内容，使用WebDriver加载: {post_url}')
+                title, description = self._fetch_post_by_driver(post_url)
+
             if not description:
                 logger.warning('帖子内容为空')
                 return None
@@ -130,12 +240,7 @@ class PostCrawler:
             event_time = self._extract_event_time(description)
             
             if event_time:
-                return {
-                    'title': title,
-                    'start_time': event_time[0],
-                    'end_time': event_time[1],
-                    'description': ''
-                }
+                return title, event_time[0], event_time[1]
             
             logger.warning(f'帖子 "{title}" 中未找到有效的时间信息')
             return None
@@ -143,31 +248,69 @@ class PostCrawler:
             logger.error(f'解析帖子内容失败: {str(e)}', exc_info=True)
             return None
 
-    def _get_element_text(self, by: str, value: str) -> str:
-        """获取元素文本内容"""
+    def _fetch_post_by_api(self, post_url: str) -> Tuple[str, str]:
+        """通过接口获取帖子标题和纯文本内容"""
         try:
-            element = self.driver.find_element(by=by, value=value)
-            return element.text.strip() if element else ''
+            post_id = post_url.rstrip('/').rsplit('/', 1)[-1]
+            response = self.session.get(POST_FULL_API_URL, params={'post_id': post_id}, timeout=WAIT_TIMEOUT)
+            data = orjson.loads(response.content)
+
+            if data['retcode'] != 0:
+                logger.warning(f'获取帖子详情接口返回错误: {data.get("message")}')
+                return '', ''
+
+            post = data['data']['post']['post']
+            content = post.get('content') or ''
+            description = _html_to_text(content) if content.strip() else ''
+            return post.get('subject', '').strip(), description
+        except Exception as e:
+            logger.warning(f'从接口获取帖子内容失败: {str(e)}', exc_info=True)
+            return '', ''
+
+    def _fetch_post_by_driver(self, post_url: str) -> Tuple[str, str]:
+        """通过WebDriver加载页面获取帖子标题和内容"""
+        self._ensure_webdriver()
+        # 同一浏览器会依次加载多个帖子，需等上一页的正文节点失效，避免读到旧内容
+        previous = self.driver.find_elements(By.CLASS_NAME, 'mhy-article-page__content')
+        # 通过CDP直接导航，不等待文档加载完成，正文节点出现即可读取
+        self.driver.execute_cdp_cmd('Page.navigate', {'url': post_url})
+        if previous:
+            self.wait.until(EC.staleness_of(previous[0]))
+
+        self.wait.until(EC.presence_of_element_located(
+            (By.CLASS_NAME, 'mhy-article-page__content')
+        ))
+
+        return self._get_title_and_body()
+
+    def _get_title_and_body(self) -> Tuple[str, str]:
+        """通过一次脚本调用同时获取标题和正文文本"""
+        try:
+            title, body = self.driver.execute_script(
+                "const text = s => (document.querySelector(s) || {}).innerText || '';"
+                "return [text('.mhy-article-page__title'), text('.mhy-article-page__content')];"
+            )
+            return title.strip(), body.strip()
         except Exception:
-            return ''
+            return '', ''
 
     def _is_valid_post_content(self, title: str, description: str) -> bool:
         """检查帖子内容是否有效"""
-        if "音擎" in description:
-            logger.info(f'帖子 "{title}" 包含音擎关键词，跳过处理')
-            return False
-
         if "代理人" not in description:
             logger.info(f'帖子 "{title}" 不包含代理人关键词，跳过处理')
             return False
 
+        if "音擎" in description:
+            logger.info(f'帖子 "{title}" 包含音擎关键词，跳过处理')
+            return False
+
         return True
 
     def _extract_agents_title(self, description: str) -> Optional[str]:
         """从描述中提取代理人信息作为标题"""
-        agents_matches = re.findall(AGENTS_PATTERN, description)
+        agents_matches = _AGENTS_RE.findall(description)
         if agents_matches:
-            unique_agents = list(dict.fromkeys(f"{match[0]}({match[1]})" for match in agents_matches))
+            unique_agents = _uniq(f"{match[0]}({match[1]})" for match in agents_matches)
             title = '、'.join(unique_agents)
             logger.info(f'从帖子中提取到代理人信息作为标题: {title}')
             return title
@@ -176,28 +319,27 @@ class PostCrawler:
     def _extract_event_time(self, description: str) -> Optional[Tuple[datetime, datetime]]:
         """从描述中提取活动时间"""
         # 尝试匹配直接时间格式
-        time_match = re.search(TIME_PATTERN, description)
+        time_match = _TIME_RE.search(description)
         if time_match:
-            return self._parse_direct_time(time_match)
+            return self._parse_direct_time(*time_match.groups())
 
         # 尝试匹配版本更新格式
-        version_match = re.search(VERSION_PATTERN, description)
+        version_match = _VERSION_RE.search(description)
         if version_match:
-            return self._parse_version_time(version_match)
+            return self._parse_version_time(*version_match.groups())
 
         return None
 
-    def _parse_direct_time(self, time_match: re.Match) -> Tuple[datetime, datetime]:
+    def _parse_direct_time(self, start_str: str, end_str: str) -> Tuple[datetime, datetime]:
         """解析直接时间格式"""
-        start_time = datetime.strptime(time_match.group(1), '%Y/%m/%d %H:%M:%S')
-        end_time = datetime.strptime(time_match.group(2), '%Y/%m/%d %H:%M:%S')
+        start_time = _fast_parse(start_str)
+        end_time = _fast_parse(end_str)
         logger.info(f'找到直接时间格式：开始时间 {start_time}, 结束时间 {end_time}')
         return start_time, end_time
 
-    def _parse_version_time(self, version_match: re.Match) -> Optional[Tuple[datetime, datetime]]:
+    def _parse_version_time(self, version: str, end_str: str) -> Optional[Tuple[datetime, datetime]]:
         """解析版本更新时间格式"""
-        version = version_match.group(1)
-        end_time = datetime.strptime(version_match.group(2), '%Y/%m/%d %H:%M:%S')
+        end_time = _fast_parse(end_str)
         
         try:
             start_time = self._get_version_start_time(version)
@@ -212,13 +354,12 @@ class PostCrawler:
     def _get_version_start_time(self, version: str) -> Optional[datetime]:
         """获取版本更新开始时间"""
         try:
-            version_data = self._load_version_data()
-            if version in version_data:
-                return datetime.fromisoformat(version_data[version])
+            if version in self._version_cache:
+                return datetime.fromisoformat(self._version_cache[version])
 
             start_time = self._fetch_version_start_time(version)
             if start_time:
-                self._save_version_data(version, start_time, version_data)
+                self._save_version_data(version, start_time)
                 return start_time
 
         except Exception as e:
@@ -226,22 +367,13 @@ class PostCrawler:
         
         return None
 
-    def _load_version_data(self) -> Dict:
-        """加载版本数据"""
-        try:
-            with open(VERSION_FILE, 'r') as f:
-                return json.load(f)
-        except Exception as e:
-            logger.warning(f'读取版本文件失败: {str(e)}', exc_info=True)
-            return {}
-
     def _fetch_version_start_time(self, version: str) -> Optional[datetime]:
         """从API获取版本更新时间"""
         try:
             logger.info(f'尝试从API获取版本 {version} 的时间')
             api_url = f'{API_BASE_URL}?keyword=【绝区零绳网情报站】{version}版本&size=1'
-            response = requests.get(api_url)
-            data = response.json()
+            response = self.session.get(api_url, timeout=WAIT_TIMEOUT)
+            data = orjson.loads(response.content)
 
             if data['retcode'] == 0 and data['data']['list']:
                 post = data['data']['list'][0]['post']
@@ -252,12 +384,13 @@ class PostCrawler:
         
         return None
 
-    def _save_version_data(self, version: str, start_time: datetime, version_data: Dict):
-        """保存版本数据"""
+    def _save_version_data(self, version: str, start_time: datetime):
+        """保存版本数据，同时更新内存缓存"""
         try:
-            version_data[version] = start_time.isoformat()
-            with open(VERSION_FILE, 'w') as f:
-                json.dump(version_data, f, indent=4)
+            with _version_lock:
+                self._version_cache[version] = start_time.isoformat()
+                with open(VERSION_FILE, 'w') as f:
+                    json.dump(self._version_cache, f, indent=4)
             logger.info(f'已更新version.json文件')
         except Exception as e:
             logger.error(f'保存版本数据失败: {str(e)}', exc_info=True)
@@ -274,77 +407,107 @@ class ICSGenerator:
         # self.calendar.add('x-wr-timezone', 'Asia/Shanghai')
         logger.info('初始化日历生成器')
 
-    def add_event(self, event_data: Dict):
+    def _make_event(self, summary: str, start: datetime, end: datetime, description: str) -> Event:
+        """直接写入已确定类型的属性构建事件，省去Event.add的类型查找"""
+        event = Event()
+        event['summary'] = vText(summary)
+        event['dtstart'] = vDatetime(start)
+        event['dtend'] = vDatetime(end)
+        event['description'] = vText(description)
+        # event['tzid'] = 'Asia/Shanghai'
+        return event
+
+    def add_event(self, title: str, start_time: datetime, end_time: datetime, description: str = ''):
         """添加活动到日历"""
         try:
-            start_time = event_data['start_time']
-            end_time = event_data['end_time']
             duration = end_time - start_time
             
             # 如果事件持续时间超过24小时，则拆分为两个事件
             if duration.total_seconds() > 24 * 3600:
-                # 添加开始事件
-                start_event = Event()
-                start_event.add('summary', f"{event_data['title']} 开始")
-                start_event.add('dtstart', start_time)
-                start_event.add('dtend', start_time + timedelta(hours=1))  # 设置1小时的持续时间
-                start_event.add('description', event_data['description'])
-                # start_event.add('tzid', 'Asia/Shanghai')
-                self.calendar.add_component(start_event)
+                # 添加开始事件，设置1小时的持续时间
+                self.calendar.add_component(self._make_event(
+                    f"{title} 开始", start_time, start_time + timedelta(hours=1), description
+                ))
                 
-                # 添加结束事件
-                end_event = Event()
-                end_event.add('summary', f"{event_data['title']} 结束")
-                end_event.add('dtstart', end_time - timedelta(hours=1))  # 从结束时间前1小时开始
-                end_event.add('dtend', end_time)
-                end_event.add('description', event_data['description'])
-                # end_event.add('tzid', 'Asia/Shanghai')
-                self.calendar.add_component(end_event)
+                # 添加结束事件，从结束时间前1小时开始
+                self.calendar.add_component(self._make_event(
+                    f"{title} 结束", end_time - timedelta(hours=1), end_time, description
+                ))
                 
-                logger.info(f'添加拆分事件到日历: {event_data["title"]} (开始和结束)')
+                logger.info(f'添加拆分事件到日历: {title} (开始和结束)')
             else:
                 # 对于短时间事件，保持原有逻辑
-                event = Event()
-                event.add('summary', event_data['title'])
-                event.add('dtstart', start_time)
-                event.add('dtend', end_time)
-                event.add('description', event_data['description'])
-                # event.add('tzid', 'Asia/Shanghai')
-                self.calendar.add_component(event)
-                logger.info(f'添加活动到日历: {event_data["title"]}')
+                self.calendar.add_component(self._make_event(title, start_time, end_time, description))
+                logger.info(f'添加活动到日历: {title}')
         except Exception as e:
             logger.error(f'添加活动到日历失败: {str(e)}', exc_info=True)
 
     def save_ics(self, filename: str):
         """保存ICS文件"""
         try:
+            # 逐个写出子组件，避免一次性生成整个日历的字节串
+            header = Calendar(self.calendar).to_ical()
+            footer = b'END:VCALENDAR\r\n'
             with open(filename, 'wb') as f:
-                f.write(self.calendar.to_ical())
+                f.write(header[:-len(footer)])
+                for component in self.calendar.subcomponents:
+                    f.write(component.to_ical())
+                f.write(footer)
             logger.info(f'ICS文件已保存: {filename}')
         except Exception as e:
             logger.error(f'保存ICS文件失败: {str(e)}', exc_info=True)
 
 
-def merge_events(events: List[Dict]) -> Dict[Tuple[str, str], Dict]:
-    """合并相同时间段的事件"""
-    events_by_time = {}
-    for event in events:
-        time_key = (event['start_time'].isoformat(), event['end_time'].isoformat())
-        if time_key not in events_by_time:
-            events_by_time[time_key] = event
-        else:
-            existing_titles = events_by_time[time_key]['title'].split('、')
-            new_titles = event['title'].split('、')
-            all_titles = list(dict.fromkeys(existing_titles + new_titles))
-            events_by_time[time_key]['title'] = '、'.join(all_titles)
-    return events_by_time
+def _uniq(items: Iterable[str]) -> List[str]:
+    """按首次出现顺序去重"""
+    seen = set()
+    result = []
+    for item in items:
+        if item not in seen:
+            seen.add(item)
+            result.append(item)
+    return result
+
+
+def merge_events(titles: List[str], start_times: List[datetime],
+                 end_times: List[datetime]) -> Dict[Tuple[datetime, datetime], str]:
+    """合并相同时间段的事件，返回各时间段合并后的标题"""
+    titles_by_time = defaultdict(list)
+    for title, start_time, end_time in zip(titles, start_times, end_times):
+        titles_by_time[(start_time, end_time)].extend(title.split('、'))
+    return {time_key: '、'.join(_uniq(parts)) for time_key, parts in titles_by_time.items()}
+
+
+def parse_posts_concurrently(posts: List[Dict[str, str]], session: Optional[requests.Session] = None,
+                             max_workers: int = MAX_WORKERS) -> List[Optional[Tuple[str, datetime, datetime]]]:
+    """使用线程池并发解析帖子内容，每个工作线程复用自己的WebDriver，并共享HTTP会话"""
+    local = threading.local()
+    crawlers = []
+    crawlers_lock = threading.Lock()
+
+    def init_worker():
+        local.crawler = PostCrawler(session)
+        with crawlers_lock:
+            crawlers.append(local.crawler)
+
+    def parse(post: Dict[str, str]) -> Optional[Tuple[str, datetime, datetime]]:
+        return local.crawler.parse_post_content(post['url'])
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers, initializer=init_worker) as executor:
+            return list(executor.map(parse, posts))
+    finally:
+        # 显式关闭各线程的浏览器，不依赖线程退出后的垃圾回收
+        for crawler in crawlers:
+            crawler.close()
 
 
 def main():
     """主函数"""
     try:
         logger.info('开始执行程序')
-        crawler = PostCrawler()
+        session = create_session()
+        crawler = PostCrawler(session)
         ics_generator = ICSGenerator()
 
         # 获取调频说明帖子
@@ -352,24 +515,26 @@ def main():
         if not posts:
             logger.error('未获取到任何帖子')
             return
+        crawler.close()
 
-        # 解析帖子内容并获取事件数据
-        events = []
-        for post in posts:
-            event_data = crawler.parse_post_content(post['url'])
-            if event_data:
-                events.append(event_data)
+        # 并发解析帖子内容并获取事件数据，每个线程持有独立的爬取器
+        titles, start_times, end_times = [], [], []
+        for event in parse_posts_concurrently(posts, session):
+            if event:
+                titles.append(event[0])
+                start_times.append(event[1])
+                end_times.append(event[2])
 
-        if not events:
+        if not titles:
             logger.error('未解析到任何有效事件')
             return
 
         # 合并相同时间段的事件
-        merged_events = merge_events(events)
+        merged_events = merge_events(titles, start_times, end_times)
 
         # 添加事件到日历
-        for event_data in merged_events.values():
-            ics_generator.add_event(event_data)
+        for (start_time, end_time), title in merged_events.items():
+            ics_generator.add_event(title, start_time, end_time)
 
         # 保存ICS文件
         ics_generator.save_ics(ICS_FILE)